@@ -1,10 +1,11 @@
 # ruff: noqa: I001
+from typing import TYPE_CHECKING, Any
 
+from .base import *
 from .calculation import *
 from .atom import *
 from .periodic_cell import *
 from .molecule import *
-from .workflows import *
 
 from .scf_settings import *
 from .int_settings import *
@@ -24,3 +25,71 @@ from .status import *
 from .constraint import *
 from .message import *
 from .types import *
+
+from . import (
+    atom,
+    base,
+    basis_set,
+    calculation,
+    constraint,
+    correction,
+    diis_settings,
+    grid_settings,
+    int_settings,
+    message,
+    method,
+    mode,
+    molecule,
+    opt_settings,
+    periodic_cell,
+    scf_settings,
+    settings,
+    solvent,
+    status,
+    task,
+    thermochem_settings,
+    types,
+    workflows,
+)
+
+if TYPE_CHECKING:
+    from .workflows import *
+
+# the star-imported modules' own exports, plus the lazily loaded workflows
+__all__ = [
+    *base.__all__,
+    *calculation.__all__,
+    *atom.__all__,
+    *periodic_cell.__all__,
+    *molecule.__all__,
+    *scf_settings.__all__,
+    *int_settings.__all__,
+    *opt_settings.__all__,
+    *diis_settings.__all__,
+    *thermochem_settings.__all__,
+    *grid_settings.__all__,
+    *settings.__all__,
+    *method.__all__,
+    *basis_set.__all__,
+    *task.__all__,
+    *correction.__all__,
+    *solvent.__all__,
+    *mode.__all__,
+    *status.__all__,
+    *constraint.__all__,
+    *message.__all__,
+    *types.__all__,
+    *workflows.__all__,
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Forward workflow names to the lazily loaded ``stjames.workflows``."""
+    if name in workflows.__all__:
+        return getattr(workflows, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *workflows.__all__})
@@ -6,6 +6,8 @@ from .base import Base
 from .data import ELEMENT_SYMBOL, SYMBOL_ELEMENT
 from .types import Vector3D
 
+__all__ = ["Atom"]
+
 
 class Atom(Base):
     atomic_number: NonNegativeInt
@@ -1,9 +1,12 @@
 from enum import Enum
+from functools import cache
 from typing import Annotated, Any, Hashable, TypeVar
 
 import numpy as np
 import pydantic
 
+__all__ = ["Base", "LowercaseStrEnum", "UniqueList"]
+
 _T = TypeVar("_T")
 
 
@@ -22,13 +25,25 @@ class LowercaseStrEnum(str, Enum):
 
     @classmethod
     def _missing_(cls, value: object) -> str | None:
-        for member in cls:
-            if isinstance(value, str):
-                if member.lower().replace("-", "").replace("_", "") == value.lower().replace("-", "").replace("_", ""):
-                    return member
+        if isinstance(value, str):
+            return _normalized_members(cls).get(_normalize(value))
         return None
 
 
+def _normalize(value: str) -> str:
+    return value.lower().replace("-", "").replace("_", "")
+
+
+@cache
+def _normalized_members(cls: type[LowercaseStrEnum]) -> dict[str, LowercaseStrEnum]:
+    """Map normalized values to members, built once per enum class."""
+    members: dict[str, LowercaseStrEnum] = {}
+    for member in cls:
+        members.setdefault(_normalize(member), member)
+
+    return members
+
+
 # cf. https://github.com/pydantic/pydantic-core/pull/820#issuecomment-1670475909
 _H = TypeVar("_H", bound=Hashable)
 
@@ -4,6 +4,8 @@ from pydantic import PositiveFloat, PositiveInt, model_validator
 
 from .base import Base
 
+__all__ = ["BasisSet", "BasisSetOverride"]
+
 
 class BasisSetOverride(Base):
     name: str
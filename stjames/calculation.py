@@ -7,6 +7,8 @@ from .settings import Settings
 from .status import Status
 from .types import UUID
 
+__all__ = ["Calculation", "StJamesVersion"]
+
 
 class StJamesVersion(LowercaseStrEnum):
     """
@@ -4,6 +4,8 @@ from pydantic import PositiveFloat, PositiveInt, model_validator
 
 from .base import Base, LowercaseStrEnum
 
+__all__ = ["Constraint", "ConstraintType", "PairwiseHarmonicConstraint", "SphericalHarmonicConstraint"]
+
 
 class ConstraintType(LowercaseStrEnum):
     """Different sorts of constraints."""
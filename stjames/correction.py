@@ -1,5 +1,7 @@
 from .base import LowercaseStrEnum
 
+__all__ = ["Correction"]
+
 
 class Correction(LowercaseStrEnum):
     """Various post hoc corrections."""
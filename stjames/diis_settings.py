@@ -2,6 +2,8 @@ import pydantic
 
 from .base import Base, LowercaseStrEnum
 
+__all__ = ["DIISSettings", "DIISStrategy"]
+
 
 class DIISStrategy(LowercaseStrEnum):
     # regular Pulay DIIS
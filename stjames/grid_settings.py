@@ -2,6 +2,8 @@ import pydantic
 
 from .base import Base, LowercaseStrEnum
 
+__all__ = ["GridSettings", "RadialGridType"]
+
 
 class RadialGridType(LowercaseStrEnum):
     """What sort of radial grid (only one option for now)"""
@@ -2,6 +2,8 @@ import pydantic
 
 from .base import Base, LowercaseStrEnum
 
+__all__ = ["ERIStrategy", "IntSettings"]
+
 
 class ERIStrategy(LowercaseStrEnum):
     # direct SCF, as per Almlof/Faegri/Korsell
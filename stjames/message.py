@@ -1,5 +1,7 @@
 from .base import Base, LowercaseStrEnum
 
+__all__ = ["Message", "MessageType"]
+
 
 class MessageType(LowercaseStrEnum):
     ERROR = "error"
@@ -2,6 +2,20 @@ from typing import Literal
 
 from .base import LowercaseStrEnum
 
+__all__ = [
+    "COMPOSITE_METHODS",
+    "CompositeMethod",
+    "METHODS_WITH_CORRECTION",
+    "Method",
+    "MethodWithCorrection",
+    "NNPMethod",
+    "NNP_METHODS",
+    "PREPACKAGED_METHODS",
+    "PrepackagedMethod",
+    "XTBMethod",
+    "XTB_METHODS",
+]
+
 
 class Method(LowercaseStrEnum):
     HARTREE_FOCK = "hf"
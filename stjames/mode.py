@@ -1,5 +1,7 @@
 from .base import LowercaseStrEnum
 
+__all__ = ["Mode"]
+
 
 class Mode(LowercaseStrEnum):
     # choose based on job type
@@ -1,3 +1,4 @@
+import math
 import re
 from pathlib import Path
 from typing import Iterable, Optional, Self
@@ -10,6 +11,8 @@ from .base import Base
 from .periodic_cell import PeriodicCell
 from .types import FloatPerAtom, Matrix3x3, Vector3D, Vector3DPerAtom
 
+__all__ = ["Molecule", "MoleculeReadError", "VibrationalMode", "parse_comment_line"]
+
 
 class MoleculeReadError(RuntimeError):
     pass
@@ -66,7 +69,7 @@ class Molecule(Base):
         >>> mol.distance(1, 2)
         1.4142135623730951
         """
-        return sum((q2 - q1) ** 2 for q1, q2 in zip(self.atoms[atom1 - 1].position, self.atoms[atom2 - 1].position)) ** 0.5  # type: ignore [no-any-return,unused-ignore]
+        return math.dist(self.atoms[atom1 - 1].position, self.atoms[atom2 - 1].position)
 
     @property
     def coordinates(self) -> Vector3DPerAtom:
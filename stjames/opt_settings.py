@@ -5,6 +5,8 @@ from pydantic import PositiveFloat, PositiveInt
 from .base import Base
 from .constraint import Constraint
 
+__all__ = ["OptimizationSettings"]
+
 
 class OptimizationSettings(Base):
     max_steps: PositiveInt = 250
@@ -6,6 +6,8 @@ import pydantic
 from .base import Base
 from .types import Matrix3x3
 
+__all__ = ["Bool3", "PeriodicCell"]
+
 Bool3: TypeAlias = tuple[bool, bool, bool]
 
 
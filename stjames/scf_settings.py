@@ -8,6 +8,8 @@ from .diis_settings import DIISSettings
 from .grid_settings import GridSettings
 from .int_settings import IntSettings
 
+__all__ = ["OrthonormalizationMethod", "SCFInitMethod", "SCFSettings"]
+
 
 class SCFInitMethod(LowercaseStrEnum):
     # (See https://manual.q-chem.com/5.2/Ch4.S4.SS2.html for a nice overview here.)
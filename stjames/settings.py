@@ -13,6 +13,8 @@ from .solvent import SolventSettings
 from .task import Task
 from .thermochem_settings import ThermochemistrySettings
 
+__all__ = ["Settings"]
+
 _T = TypeVar("_T")
 
 
@@ -36,14 +38,14 @@ class Settings(Base):
     @computed_field  # type: ignore[misc, prop-decorator, unused-ignore]
     @property
     def level_of_theory(self) -> str:
-        corrections = list(filter(lambda x: x not in (None, ""), self.corrections))
+        corrections = "-".join(c.value for c in self.corrections if c)
 
         if self.method in PREPACKAGED_METHODS or self.basis_set is None:
             method = self.method.value
-        elif self.method in METHODS_WITH_CORRECTION or len(corrections) == 0:
+        elif self.method in METHODS_WITH_CORRECTION or not corrections:
             method = f"{self.method.value}/{self.basis_set.name.lower()}"
         else:
-            method = f"{self.method.value}-{'-'.join([c.value for c in corrections])}/{self.basis_set.name.lower()}"
+            method = f"{self.method.value}-{corrections}/{self.basis_set.name.lower()}"
 
         if self.solvent_settings is not None:
             method += f"/{self.solvent_settings.model.value}({self.solvent_settings.solvent.value})"
@@ -64,16 +66,20 @@ class Settings(Base):
         if self.mode == Mode.AUTO:
             self.mode = Mode.RAPID
 
-        self.scf_settings = _assign_scf_settings_by_mode(self.mode, self.scf_settings)
-        self.opt_settings = _assign_opt_settings_by_mode(self.mode, self.opt_settings)
+        # MANUAL keeps the SCF and optimization settings exactly as given
+        if self.mode != Mode.MANUAL:
+            self.scf_settings = _assign_scf_settings_by_mode(self.mode, self.scf_settings)
+            self.opt_settings = _assign_opt_settings_by_mode(self.mode, self.opt_settings)
 
         return self
 
     def model_post_init(self, __context: Any) -> None:
         # figure out `optimize_ts`
         if Task.OPTIMIZE_TS in self.tasks:
-            self.tasks.pop(self.tasks.index(Task.OPTIMIZE_TS))
-            self.tasks.append(Task.OPTIMIZE)
+            self.tasks.remove(Task.OPTIMIZE_TS)
+            # keep ``tasks`` unique if both were requested
+            if Task.OPTIMIZE not in self.tasks:
+                self.tasks.append(Task.OPTIMIZE)
             self.opt_settings.transition_state = True
 
         # composite methods have their own basis sets, so overwrite user stuff
@@ -111,106 +117,91 @@ class Settings(Base):
         return [c for c in v if c] if v is not None else v
 
 
+# (SCFSettings, IntSettings) overrides for each mode, cf. ``_assign_scf_settings_by_mode``
+#
+# Values based off of the following sources:
+# QChem:
+#     - https://manual.q-chem.com/5.2/Ch4.S3.SS2.html
+#     - https://manual.q-chem.com/5.2/Ch4.S5.SS2.html
+#
+# Gaussian:
+#     - https://gaussian.com/integral/
+#     - https://gaussian.com/overlay5/
+#
+# Orca:
+#     - manual 4.2.1, §9.6.1 and §9.7.3
+#
+# Psi4:
+#     - https://psicode.org/psi4manual/master/autodir_options_c/module__scf.html
+#     - https://psicode.org/psi4manual/master/autodoc_glossary_options_c.html
+#
+# TeraChem:
+#     - Manual, it's easy to locate everything.
+#
+# The below values are my best attempt at homogenizing various sources.
+# In general, eri_threshold should be 3 OOM lower than SCF convergence.
+_SCF_PRESETS: dict[Mode, tuple[dict[str, Any], dict[str, Any]]] = {
+    Mode.RECKLESS: (
+        {"energy_threshold": 1e-5, "rms_error_threshold": 1e-7, "max_error_threshold": 1e-5, "rebuild_frequency": 100},
+        {"eri_threshold": 1e-8, "csam_multiplier": 3.0, "pair_overlap_threshold": 1e-8},
+    ),
+    Mode.RAPID: (
+        {"energy_threshold": 1e-6, "rms_error_threshold": 1e-9, "max_error_threshold": 1e-7, "rebuild_frequency": 10},
+        {"eri_threshold": 1e-10, "csam_multiplier": 1.0, "pair_overlap_threshold": 1e-10},
+    ),
+    Mode.METICULOUS: (
+        {"energy_threshold": 1e-8, "rms_error_threshold": 1e-9, "max_error_threshold": 1e-7, "rebuild_frequency": 5},
+        {"eri_threshold": 1e-12, "csam_multiplier": 1.0, "pair_overlap_threshold": 1e-12},
+    ),
+    Mode.DEBUG: (
+        {"energy_threshold": 1e-9, "rms_error_threshold": 1e-10, "max_error_threshold": 1e-9, "rebuild_frequency": 1},
+        # csam_multiplier of 1e10, in other words, disable CSAM
+        {"eri_threshold": 1e-14, "csam_multiplier": 1e10, "pair_overlap_threshold": 1e-14},
+    ),
+}
+_SCF_PRESETS[Mode.CAREFUL] = _SCF_PRESETS[Mode.RAPID]
+
+# OptimizationSettings overrides for each mode, cf. ``_assign_opt_settings_by_mode``
+#
+# Constraints lead to a lot of noise, so we need to loosen the thresholds.
+#
+# cf. DLFIND manual, and https://www.cup.uni-muenchen.de/ch/compchem/geom/basic.html
+# and the discussion at https://geometric.readthedocs.io/en/latest/how-it-works.html
+# in periodic systems, "normal" is 0.05 eV/Å ~= 2e-3 Hartree/Å, and "careful" is 0.01 ~= 4e-4
+#
+# Note: thresholds here are in units of Hartree/Å, not Hartree/Bohr as listed in many places.
+_OPT_PRESETS: dict[Mode, dict[str, Any]] = {
+    Mode.RECKLESS: {"energy_threshold": 2e-5, "max_gradient_threshold": 7e-3, "rms_gradient_threshold": 6e-3},
+    Mode.RAPID: {"energy_threshold": 5e-5, "max_gradient_threshold": 5e-3, "rms_gradient_threshold": 3.5e-3},
+    Mode.CAREFUL: {"energy_threshold": 1e-6, "max_gradient_threshold": 9e-4, "rms_gradient_threshold": 6e-4},
+    Mode.METICULOUS: {"energy_threshold": 1e-6, "max_gradient_threshold": 3e-5, "rms_gradient_threshold": 2e-5},
+    Mode.DEBUG: {"energy_threshold": 1e-6, "max_gradient_threshold": 4e-6, "rms_gradient_threshold": 2e-6},
+}
+
+
 def _assign_scf_settings_by_mode(mode: Mode, scf_settings: SCFSettings) -> SCFSettings:
-    """
-    Assign SCF settings based on the mode.
-
-    Values based off of the following sources:
-    QChem:
-        - https://manual.q-chem.com/5.2/Ch4.S3.SS2.html
-        - https://manual.q-chem.com/5.2/Ch4.S5.SS2.html
-
-    Gaussian:
-        - https://gaussian.com/integral/
-        - https://gaussian.com/overlay5/
-
-    Orca:
-        - manual 4.2.1, §9.6.1 and §9.7.3
-
-    Psi4:
-        - https://psicode.org/psi4manual/master/autodir_options_c/module__scf.html
-        - https://psicode.org/psi4manual/master/autodoc_glossary_options_c.html
-
-    TeraChem:
-        - Manual, it's easy to locate everything.
-
-    The below values are my best attempt at homogenizing various sources.
-    In general, eri_threshold should be 3 OOM lower than SCF convergence.
-    """
-    if mode == Mode.MANUAL:
-        return scf_settings
-
-    match mode:
-        case Mode.RECKLESS:
-            scf_settings.energy_threshold = 1e-5
-            scf_settings.rms_error_threshold = 1e-7
-            scf_settings.max_error_threshold = 1e-5
-            scf_settings.rebuild_frequency = 100
-            scf_settings.int_settings.eri_threshold = 1e-8
-            scf_settings.int_settings.csam_multiplier = 3.0
-            scf_settings.int_settings.pair_overlap_threshold = 1e-8
-        case Mode.RAPID | Mode.CAREFUL:
-            scf_settings.energy_threshold = 1e-6
-            scf_settings.rms_error_threshold = 1e-9
-            scf_settings.max_error_threshold = 1e-7
-            scf_settings.rebuild_frequency = 10
-            scf_settings.int_settings.eri_threshold = 1e-10
-            scf_settings.int_settings.csam_multiplier = 1.0
-            scf_settings.int_settings.pair_overlap_threshold = 1e-10
-        case Mode.METICULOUS:
-            scf_settings.energy_threshold = 1e-8
-            scf_settings.rms_error_threshold = 1e-9
-            scf_settings.max_error_threshold = 1e-7
-            scf_settings.rebuild_frequency = 5
-            scf_settings.int_settings.eri_threshold = 1e-12
-            scf_settings.int_settings.csam_multiplier = 1.0
-            scf_settings.int_settings.pair_overlap_threshold = 1e-12
-        case Mode.DEBUG:
-            scf_settings.energy_threshold = 1e-9
-            scf_settings.rms_error_threshold = 1e-10
-            scf_settings.max_error_threshold = 1e-9
-            scf_settings.rebuild_frequency = 1
-            scf_settings.int_settings.eri_threshold = 1e-14
-            scf_settings.int_settings.csam_multiplier = 1e10  # in other words, disable CSAM
-            scf_settings.int_settings.pair_overlap_threshold = 1e-14
-        case _:
-            raise ValueError(f"Unknown mode ``{mode.value}``!")
+    """Assign SCF settings based on the mode, from ``_SCF_PRESETS``."""
+    try:
+        scf_preset, int_preset = _SCF_PRESETS[mode]
+    except KeyError:
+        raise ValueError(f"Unknown mode ``{mode.value}``!") from None
+
+    for name, value in scf_preset.items():
+        setattr(scf_settings, name, value)
+    for name, value in int_preset.items():
+        setattr(scf_settings.int_settings, name, value)
 
     return scf_settings
 
 
 def _assign_opt_settings_by_mode(mode: Mode, opt_settings: OptimizationSettings) -> OptimizationSettings:
-    """
-    Assign optimization settings based on the mode.
-
-    Constraints lead to a lot of noise, so we need to loosen the thresholds.
-
-    cf. DLFIND manual, and https://www.cup.uni-muenchen.de/ch/compchem/geom/basic.html
-    and the discussion at https://geometric.readthedocs.io/en/latest/how-it-works.html
-    in periodic systems, "normal" is 0.05 eV/Å ~= 2e-3 Hartree/Å, and "careful" is 0.01 ~= 4e-4
-
-    Note: thresholds here are in units of Hartree/Å, not Hartree/Bohr as listed in many places.
-    """
-    opt_settings.energy_threshold = 1e-6
-    match mode:
-        case Mode.RECKLESS:
-            opt_settings.energy_threshold = 2e-5
-            opt_settings.max_gradient_threshold = 7e-3
-            opt_settings.rms_gradient_threshold = 6e-3
-        case Mode.RAPID:
-            opt_settings.energy_threshold = 5e-5
-            opt_settings.max_gradient_threshold = 5e-3
-            opt_settings.rms_gradient_threshold = 3.5e-3
-        case Mode.CAREFUL:
-            opt_settings.max_gradient_threshold = 9e-4
-            opt_settings.rms_gradient_threshold = 6e-4
-        case Mode.METICULOUS:
-            opt_settings.max_gradient_threshold = 3e-5
-            opt_settings.rms_gradient_threshold = 2e-5
-        case Mode.DEBUG:
-            opt_settings.max_gradient_threshold = 4e-6
-            opt_settings.rms_gradient_threshold = 2e-6
-        case _:
-            raise ValueError(f"Unknown mode ``{mode.value}``!")
+    """Assign optimization settings based on the mode, from ``_OPT_PRESETS``."""
+    try:
+        opt_preset = _OPT_PRESETS[mode]
+    except KeyError:
+        raise ValueError(f"Unknown mode ``{mode.value}``!") from None
+
+    for name, value in opt_preset.items():
+        setattr(opt_settings, name, value)
 
     return opt_settings
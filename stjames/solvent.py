@@ -1,5 +1,9 @@
+from pydantic import ConfigDict
+
 from .base import Base, LowercaseStrEnum
 
+__all__ = ["Solvent", "SolventModel", "SolventSettings"]
+
 
 class Solvent(LowercaseStrEnum):
     WATER = "water"
@@ -40,5 +44,7 @@ class SolventModel(LowercaseStrEnum):
 
 
 class SolventSettings(Base):
+    model_config = ConfigDict(frozen=True)
+
     solvent: Solvent
     model: SolventModel
@@ -1,5 +1,7 @@
 from enum import Enum
 
+__all__ = ["Status"]
+
 
 class Status(int, Enum):
     # what a job gets when it's created
@@ -1,5 +1,7 @@
 from .base import LowercaseStrEnum
 
+__all__ = ["Task"]
+
 
 class Task(LowercaseStrEnum):
     ENERGY = "energy"
@@ -2,8 +2,12 @@ import pydantic
 
 from .base import Base
 
+__all__ = ["ThermochemistrySettings"]
+
 
 class ThermochemistrySettings(Base):
+    model_config = pydantic.ConfigDict(frozen=True)
+
     # Cramer/Truhlar cutoff freq (cm-1)
     cutoff_frequency: pydantic.NonNegativeFloat = 100
 
@@ -1,5 +1,7 @@
 from typing import TypeAlias
 
+__all__ = ["FloatPerAtom", "Matrix3x3", "UUID", "Vector3D", "Vector3DPerAtom"]
+
 UUID: TypeAlias = str
 
 Vector3D: TypeAlias = tuple[float, float, float]
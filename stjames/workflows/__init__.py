@@ -1,22 +1,165 @@
-# ruff: noqa: F405
-from typing import Literal
-
-from .admet import *
-from .basic_calculation import *
-from .bde import *
-from .conformer import *
-from .conformer_search import *
-from .descriptors import *
-from .electronic_properties import *
-from .fukui import *
-from .molecular_dynamics import *
-from .multistage_opt import *
-from .pka import *
-from .redox_potential import *
-from .scan import *
-from .spin_states import *
-from .tautomer import *
-from .workflow import Workflow
+"""Workflows, imported lazily from their submodules on first access (PEP 562)."""
+
+import sys
+from collections.abc import Iterator, Mapping
+from functools import cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal
+
+from .workflow import DBCalculation as DBCalculation
+from .workflow import Workflow as Workflow
+
+if TYPE_CHECKING:
+    from .admet import ADMETWorkflow as ADMETWorkflow
+    from .basic_calculation import BasicCalculationWorkflow as BasicCalculationWorkflow
+    from .bde import BDE as BDE
+    from .bde import BDEWorkflow as BDEWorkflow
+    from .bde import atomic_number_indices as atomic_number_indices
+    from .bde import find_AB_bonds as find_AB_bonds
+    from .bde import find_CH_bonds as find_CH_bonds
+    from .bde import find_CX_bonds as find_CX_bonds
+    from .conformer import Conformer as Conformer
+    from .conformer import ConformerSettings as ConformerSettings
+    from .conformer import ConformerWorkflow as ConformerWorkflow
+    from .conformer import CrestConformerSettings as CrestConformerSettings
+    from .conformer import RdkitConformerSettings as RdkitConformerSettings
+    from .conformer import csearch_settings_by_mode as csearch_settings_by_mode
+    from .conformer_search import ConformerGenMixin as ConformerGenMixin
+    from .conformer_search import ConformerGenSettings as ConformerGenSettings
+    from .conformer_search import ConformerSearchMixin as ConformerSearchMixin
+    from .conformer_search import ConformerSearchWorkflow as ConformerSearchWorkflow
+    from .conformer_search import ETKDGSettings as ETKDGSettings
+    from .conformer_search import ScreeningSettings as ScreeningSettings
+    from .conformer_search import check_sentinel as check_sentinel
+    from .conformer_search import iMTDGCSettings as iMTDGCSettings
+    from .conformer_search import iMTDSettings as iMTDSettings
+    from .conformer_search import iMTDsMTDSettings as iMTDsMTDSettings
+    from .conformer_search import iMTDSpeeds as iMTDSpeeds
+    from .descriptors import Descriptors as Descriptors
+    from .descriptors import DescriptorsWorkflow as DescriptorsWorkflow
+    from .electronic_properties import ElectronicPropertiesWorkflow as ElectronicPropertiesWorkflow
+    from .electronic_properties import MolecularOrbitalCube as MolecularOrbitalCube
+    from .electronic_properties import PropertyCube as PropertyCube
+    from .electronic_properties import PropertyCubePoint as PropertyCubePoint
+    from .fukui import FukuiIndexWorkflow as FukuiIndexWorkflow
+    from .molecular_dynamics import Frame as Frame
+    from .molecular_dynamics import MolecularDynamicsInitialization as MolecularDynamicsInitialization
+    from .molecular_dynamics import MolecularDynamicsSettings as MolecularDynamicsSettings
+    from .molecular_dynamics import MolecularDynamicsWorkflow as MolecularDynamicsWorkflow
+    from .molecular_dynamics import ThermodynamicEnsemble as ThermodynamicEnsemble
+    from .multistage_opt import MultiStageOptMixin as MultiStageOptMixin
+    from .multistage_opt import MultiStageOptSettings as MultiStageOptSettings
+    from .multistage_opt import MultiStageOptWorkflow as MultiStageOptWorkflow
+    from .multistage_opt import build_mso_settings as build_mso_settings
+    from .pka import pKaMicrostate as pKaMicrostate
+    from .pka import pKaWorkflow as pKaWorkflow
+    from .redox_potential import RedoxPotentialWorkflow as RedoxPotentialWorkflow
+    from .scan import ScanPoint as ScanPoint
+    from .scan import ScanSettings as ScanSettings
+    from .scan import ScanWorkflow as ScanWorkflow
+    from .spin_states import SpinState as SpinState
+    from .spin_states import SpinStatesWorkflow as SpinStatesWorkflow
+    from .tautomer import Tautomer as Tautomer
+    from .tautomer import TautomerWorkflow as TautomerWorkflow
+
+# public name -> submodule defining it
+_LAZY_IMPORTS: dict[str, str] = {
+    "ADMETWorkflow": ".admet",
+    "BasicCalculationWorkflow": ".basic_calculation",
+    "BDE": ".bde",
+    "BDEWorkflow": ".bde",
+    "atomic_number_indices": ".bde",
+    "find_AB_bonds": ".bde",
+    "find_CH_bonds": ".bde",
+    "find_CX_bonds": ".bde",
+    "Conformer": ".conformer",
+    "ConformerSettings": ".conformer",
+    "ConformerWorkflow": ".conformer",
+    "CrestConformerSettings": ".conformer",
+    "RdkitConformerSettings": ".conformer",
+    "csearch_settings_by_mode": ".conformer",
+    "ConformerGenMixin": ".conformer_search",
+    "ConformerGenSettings": ".conformer_search",
+    "ConformerSearchMixin": ".conformer_search",
+    "ConformerSearchWorkflow": ".conformer_search",
+    "ETKDGSettings": ".conformer_search",
+    "ScreeningSettings": ".conformer_search",
+    "check_sentinel": ".conformer_search",
+    "iMTDGCSettings": ".conformer_search",
+    "iMTDSettings": ".conformer_search",
+    "iMTDsMTDSettings": ".conformer_search",
+    "iMTDSpeeds": ".conformer_search",
+    "Descriptors": ".descriptors",
+    "DescriptorsWorkflow": ".descriptors",
+    "ElectronicPropertiesWorkflow": ".electronic_properties",
+    "MolecularOrbitalCube": ".electronic_properties",
+    "PropertyCube": ".electronic_properties",
+    "PropertyCubePoint": ".electronic_properties",
+    "FukuiIndexWorkflow": ".fukui",
+    "Frame": ".molecular_dynamics",
+    "MolecularDynamicsInitialization": ".molecular_dynamics",
+    "MolecularDynamicsSettings": ".molecular_dynamics",
+    "MolecularDynamicsWorkflow": ".molecular_dynamics",
+    "ThermodynamicEnsemble": ".molecular_dynamics",
+    "MultiStageOptMixin": ".multistage_opt",
+    "MultiStageOptSettings": ".multistage_opt",
+    "MultiStageOptWorkflow": ".multistage_opt",
+    "build_mso_settings": ".multistage_opt",
+    "pKaMicrostate": ".pka",
+    "pKaWorkflow": ".pka",
+    "RedoxPotentialWorkflow": ".redox_potential",
+    "ScanPoint": ".scan",
+    "ScanSettings": ".scan",
+    "ScanWorkflow": ".scan",
+    "SpinState": ".spin_states",
+    "SpinStatesWorkflow": ".spin_states",
+    "Tautomer": ".tautomer",
+    "TautomerWorkflow": ".tautomer",
+}
+
+__all__ = [
+    "DBCalculation",
+    "Workflow",
+    "WORKFLOW_NAME",
+    "WORKFLOW_MAPPING",
+    *_LAZY_IMPORTS,
+]
+
+
+@cache
+def _cached_import(module: str, name: str) -> Any:
+    """
+    Get ``name`` from ``module``, only going through the import machinery if it isn't loaded yet.
+
+    >>> _cached_import("stjames.workflows.workflow", "Workflow") is Workflow
+    True
+    """
+    modules = sys.modules
+    if (mod := modules.get(module)) is None:
+        mod = import_module(module)
+
+    return getattr(mod, name)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    if name in _LAZY_IMPORTS:
+        value = _cached_import(f"{__name__}{_LAZY_IMPORTS[name]}", name)
+    elif f".{name}" in _LAZY_IMPORTS.values():
+        # submodules, e.g. ``stjames.workflows.bde``
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache, so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 WORKFLOW_NAME = Literal[
     "admet",
@@ -36,20 +179,48 @@ WORKFLOW_NAME = Literal[
     "tautomers",
 ]
 
-WORKFLOW_MAPPING: dict[str, Workflow] = {
-    "admet": ADMETWorkflow,  # type: ignore [dict-item]
-    "basic_calculation": BasicCalculationWorkflow,  # type: ignore [dict-item]
-    "bde": BDEWorkflow,  # type: ignore [dict-item]
-    "conformers": ConformerWorkflow,  # type: ignore [dict-item]
-    "conformer_search": ConformerSearchWorkflow,  # type: ignore [dict-item]
-    "descriptors": DescriptorsWorkflow,  # type: ignore [dict-item]
-    "electronic_properties": ElectronicPropertiesWorkflow,  # type: ignore [dict-item]
-    "fukui": FukuiIndexWorkflow,  # type: ignore [dict-item]
-    "molecular_dynamics": MolecularDynamicsWorkflow,  # type: ignore [dict-item]
-    "multistage_opt": MultiStageOptWorkflow,  # type: ignore [dict-item]
-    "pka": pKaWorkflow,  # type: ignore [dict-item]
-    "redox_potential": RedoxPotentialWorkflow,  # type: ignore [dict-item]
-    "scan": ScanWorkflow,  # type: ignore [dict-item]
-    "spin_states": SpinStatesWorkflow,  # type: ignore [dict-item]
-    "tautomers": TautomerWorkflow,  # type: ignore [dict-item]
-}
+
+class _LazyWorkflowMapping(Mapping[str, type[Workflow]]):
+    """
+    Read-only mapping of workflow name to ``Workflow`` class, importing each class on first lookup.
+
+    :param names: workflow name -> class name in this package
+    """
+
+    def __init__(self, names: dict[str, str]) -> None:
+        self._names = MappingProxyType({sys.intern(key): name for key, name in names.items()})
+
+    def __getitem__(self, key: str) -> type[Workflow]:
+        name = self._names[key]
+        cls: type[Workflow] = _cached_import(f"{__name__}{_LAZY_IMPORTS[name]}", name)
+        return cls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._names)!r})"
+
+
+WORKFLOW_MAPPING: Mapping[str, type[Workflow]] = _LazyWorkflowMapping(
+    {
+        "admet": "ADMETWorkflow",
+        "basic_calculation": "BasicCalculationWorkflow",
+        "bde": "BDEWorkflow",
+        "conformers": "ConformerWorkflow",
+        "conformer_search": "ConformerSearchWorkflow",
+        "descriptors": "DescriptorsWorkflow",
+        "electronic_properties": "ElectronicPropertiesWorkflow",
+        "fukui": "FukuiIndexWorkflow",
+        "molecular_dynamics": "MolecularDynamicsWorkflow",
+        "multistage_opt": "MultiStageOptWorkflow",
+        "pka": "pKaWorkflow",
+        "redox_potential": "RedoxPotentialWorkflow",
+        "scan": "ScanWorkflow",
+        "spin_states": "SpinStatesWorkflow",
+        "tautomers": "TautomerWorkflow",
+    }
+)
@@ -2,6 +2,8 @@ from typing import Optional
 
 from .workflow import Workflow
 
+__all__ = ["ADMETWorkflow"]
+
 
 class ADMETWorkflow(Workflow):
     properties: Optional[dict[str, float | int]] = None
@@ -2,6 +2,8 @@ from ..settings import Settings
 from ..types import UUID
 from .workflow import Workflow
 
+__all__ = ["BasicCalculationWorkflow"]
+
 
 class BasicCalculationWorkflow(Workflow):
     settings: Settings
@@ -1,9 +1,9 @@
 """Bond Dissociation Energy (BDE) workflow."""
 
-import itertools
 from typing import Any, Iterable, Self, TypeVar
 
-from pydantic import BaseModel, Field, PositiveInt, ValidationInfo, field_validator, model_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, ValidationInfo, field_validator, model_validator
 
 from ..mode import Mode
 from ..molecule import Molecule
@@ -11,10 +11,25 @@ from ..types import UUID
 from .multistage_opt import MultiStageOptMixin
 from .workflow import Workflow
 
-# the id of a mutable object may change, thus using object()
-_sentinel_mso_mode = object()
+__all__ = ["BDE", "BDEWorkflow", "atomic_number_indices", "find_AB_bonds", "find_CH_bonds", "find_CX_bonds"]
+
 _T = TypeVar("_T")
 
+# mode -> (default for optimize_fragments, whether it overrides the user's choice)
+_OPTIMIZE_FRAGMENTS_BY_MODE: dict[Mode, tuple[bool, bool]] = {
+    # GFN-FF doesn't support open-shell species
+    Mode.RECKLESS: (False, True),
+    Mode.RAPID: (True, False),
+    Mode.CAREFUL: (True, False),
+    Mode.METICULOUS: (True, False),
+}
+
+# distance max for a C–H bond
+_CH_DISTANCE_MAX = 1.2
+
+# halogen atomic number -> distance max for a C–X bond
+_HALOGEN_DISTANCE_MAX: dict[int, float] = {9: 2.0, 17: 2.2, 35: 2.5, 53: 2.8, 85: 3.0, 117: 4.0}
+
 
 class BDE(BaseModel):
     """
@@ -28,6 +43,8 @@ class BDE(BaseModel):
     :param calculations_uuids: calculation UUIDs
     """
 
+    model_config = ConfigDict(frozen=True)
+
     fragment_idxs: tuple[PositiveInt, ...]
     energy: float | None
     fragment_energies: tuple[float | None, float | None]
@@ -80,7 +97,6 @@ class BDEWorkflow(Workflow, MultiStageOptMixin):
     :param bdes: BDE results
     """
 
-    mso_mode: Mode = _sentinel_mso_mode  # type: ignore [assignment]
     optimize_fragments: bool = None  # type: ignore [assignment]
 
     atoms: tuple[PositiveInt, ...] = Field(default_factory=tuple)
@@ -141,41 +157,43 @@ class BDEWorkflow(Workflow, MultiStageOptMixin):
     @classmethod
     def set_mso_mode(cls, values: dict[str, Any]) -> dict[str, Any]:
         """Set the MultiStageOptSettings mode to match current BDE mode."""
-        values["mso_mode"] = values["mode"]
-        return values
+        mode = values.get("mode", Mode.AUTO)
+        # set mode explicitly too, as the default isn't validated (AUTO -> RAPID); copy to leave the caller's dict alone
+        return {**values, "mode": mode, "mso_mode": mode}
 
     @model_validator(mode="after")
     def validate_and_build(self) -> Self:
         """Validate atomic numbers and build the atoms field."""
-        self.atoms = tuple(self.atoms)
-        self.fragment_indices = tuple(map(tuple, self.fragment_indices))
-
-        match self.mode:
-            case Mode.RECKLESS:
-                # GFN-FF doesn't support open-shell species
-                self.optimize_fragments = False
-            case Mode.RAPID | Mode.CAREFUL | Mode.METICULOUS:
-                # Default on
-                self.optimize_fragments = self.optimize_fragments or self.optimize_fragments is None
-            case _:
-                raise NotImplementedError(f"{self.mode} not implemented.")
-
-        for atom in self.atoms:
-            if atom > len(self.initial_molecule):
-                raise ValueError(f"{atom=} is out of range.")
+        try:
+            optimize_fragments, forced = _OPTIMIZE_FRAGMENTS_BY_MODE[self.mode]
+        except KeyError:
+            raise NotImplementedError(f"{self.mode} not implemented.") from None
+        if forced or self.optimize_fragments is None:
+            self.optimize_fragments = optimize_fragments
+
+        n = len(self.initial_molecule)
+        if self.atoms and max(self.atoms) > n:
+            atom = next(atom for atom in self.atoms if atom > n)
+            raise ValueError(f"{atom=} is out of range.")
+
+        # validate, and remove duplicates, in a single pass
+        fragment_indices: set[tuple[PositiveInt, ...]] = set()
         for fragment_idxs in self.fragment_indices:
-            if any(a > len(self.initial_molecule) for a in fragment_idxs):
+            if max(fragment_idxs, default=0) > n:
                 raise ValueError(f"{fragment_idxs=} contains atoms that are out of range.")
+            fragment_indices.add(fragment_idxs)
 
-        if self.all_CH:
-            self.atoms = self.atoms + tuple(H for _C, H in find_CH_bonds(self.initial_molecule))
+        # search C–H and C–X bonds together, sharing the coordinates and atomic-number grouping
+        distances_max = {1: _CH_DISTANCE_MAX} if self.all_CH else {}
         if self.all_CX:
-            self.atoms = self.atoms + tuple(X for _C, X in find_CX_bonds(self.initial_molecule))
+            distances_max |= _HALOGEN_DISTANCE_MAX
+
+        if distances_max:
+            self.atoms += tuple(X for _C, X in _find_bonds_to_carbon(self.initial_molecule, distances_max))
 
-        # Combine atoms and fragments, remove duplicates, and sort
-        self.fragment_indices = self.fragment_indices + tuple((a,) for a in self.atoms)
-        assert isinstance(self.fragment_indices, tuple)
-        self.fragment_indices = tuple(sorted(set(self.fragment_indices)))
+        # Combine atoms and fragments, and sort
+        fragment_indices.update((a,) for a in self.atoms)
+        self.fragment_indices = tuple(sorted(fragment_indices))
 
         return self
 
@@ -196,11 +214,28 @@ def atomic_number_indices(molecule: Molecule, atomic_numbers: set[PositiveInt] |
     ()
     """
     if isinstance(atomic_numbers, int):
-        return tuple(i for i, an in enumerate(molecule.atomic_numbers, start=1) if an == atomic_numbers)
+        atomic_numbers = {atomic_numbers}
+
     return tuple(i for i, an in enumerate(molecule.atomic_numbers, start=1) if an in atomic_numbers)
 
 
-def find_CH_bonds(molecule: Molecule, distance_max: float = 1.2) -> Iterable[tuple[PositiveInt, PositiveInt]]:
+def _group_by_atomic_number(molecule: Molecule) -> dict[int, tuple[PositiveInt, ...]]:
+    r"""
+    Group the atom indices by atomic number, in a single pass over the molecule.
+
+    :param molecule: Molecule of interest
+
+    >>> _group_by_atomic_number(Molecule.from_xyz("H 0 0 0\nO 0 0 1\nH 0 1 1"))
+    {1: (1, 3), 8: (2,)}
+    """
+    groups: dict[int, list[PositiveInt]] = {}
+    for i, an in enumerate(molecule.atomic_numbers, start=1):
+        groups.setdefault(an, []).append(i)
+
+    return {an: tuple(idxs) for an, idxs in groups.items()}
+
+
+def find_CH_bonds(molecule: Molecule, distance_max: float = _CH_DISTANCE_MAX) -> Iterable[tuple[PositiveInt, PositiveInt]]:
     r"""
     Find all C–H bonds in the molecule.
 
@@ -217,7 +252,7 @@ def find_CH_bonds(molecule: Molecule, distance_max: float = 1.2) -> Iterable[tup
     >>> list(find_CH_bonds(ethane))
     [(1, 3), (1, 4), (1, 5), (2, 6), (2, 7), (2, 8)]
     """
-    yield from find_AB_bonds(molecule, 6, 1, distance_max)
+    yield from _find_bonds_to_carbon(molecule, {1: distance_max})
 
 
 def find_CX_bonds(molecule: Molecule) -> Iterable[tuple[PositiveInt, PositiveInt]]:
@@ -231,8 +266,29 @@ def find_CX_bonds(molecule: Molecule) -> Iterable[tuple[PositiveInt, PositiveInt
     >>> list(find_CX_bonds(HCF))
     [(2, 3)]
     """
-    halogens = {9: 2.0, 17: 2.2, 35: 2.5, 53: 2.8, 85: 3.0, 117: 4.0}
-    yield from itertools.chain.from_iterable(find_AB_bonds(molecule, 6, x, distance) for x, distance in halogens.items())
+    yield from _find_bonds_to_carbon(molecule, _HALOGEN_DISTANCE_MAX)
+
+
+def _find_bonds_to_carbon(molecule: Molecule, distances_max: dict[int, float]) -> Iterable[tuple[PositiveInt, PositiveInt]]:
+    r"""
+    Find all bonds from carbon to the given elements, sharing one atomic-number grouping and coordinate array.
+
+    :param molecule: Molecule of interest
+    :param distances_max: atomic number -> distance max for its bond to carbon
+
+    >>> HCF = Molecule.from_xyz("H 0 0 0\nC 0 0 1\nF 0 1 1")
+    >>> list(_find_bonds_to_carbon(HCF, {1: 1.2, 9: 2.0}))
+    [(2, 1), (2, 3)]
+    """
+    groups = _group_by_atomic_number(molecule)
+    # only scan for the elements actually present (in table order, to keep the output order stable)
+    partners = [(x, distance_max) for x, distance_max in distances_max.items() if x in groups]
+    if 6 not in groups or not partners:
+        return
+
+    coordinates = np.array(molecule.coordinates)
+    for x, distance_max in partners:
+        yield from _find_AB_bonds_indexed(coordinates, groups[6], groups[x], distance_max)
 
 
 def find_AB_bonds(molecule: Molecule, a: int, b: int, distance_max: float) -> Iterable[tuple[PositiveInt, PositiveInt]]:
@@ -248,14 +304,35 @@ def find_AB_bonds(molecule: Molecule, a: int, b: int, distance_max: float) -> It
     >>> list(find_AB_bonds(H2O, 8, 1, 1.1))
     [(2, 1), (2, 3)]
     """
+    a_idxs = atomic_number_indices(molecule, a)
+    b_idxs = atomic_number_indices(molecule, b)
+    if not (a_idxs and b_idxs):
+        return
+
+    yield from _find_AB_bonds_indexed(np.array(molecule.coordinates), a_idxs, b_idxs, distance_max)
+
+
+def _find_AB_bonds_indexed(
+    coordinates: np.ndarray,
+    a_idxs: tuple[PositiveInt, ...],
+    b_idxs: tuple[PositiveInt, ...],
+    distance_max: float,
+) -> Iterable[tuple[PositiveInt, PositiveInt]]:
+    """
+    Find all A–B bonds, given the indices of the A and B atoms.
+
+    :param coordinates: coordinates of all atoms in the molecule
+    :param a_idxs: indices of the A atoms (1-indexed, non-empty)
+    :param b_idxs: indices of the B atoms (1-indexed, non-empty)
+    :param distance_max: distance max for bond
+    """
+    a = np.array(a_idxs)
+    b = np.array(b_idxs)
 
-    def close(idxs: tuple[PositiveInt, PositiveInt]) -> bool:
-        return molecule.distance(*idxs) < distance_max
+    # compare squared distances for all pairs at once, no need for the sqrt
+    displacements = coordinates[a - 1, None, :] - coordinates[None, b - 1, :]
+    close = np.einsum("ijk,ijk->ij", displacements, displacements) < distance_max**2
 
-    yield from filter(
-        close,
-        itertools.product(
-            atomic_number_indices(molecule, a),
-            atomic_number_indices(molecule, b),
-        ),
-    )
+    # nonzero is row-major, keeping the (A, B) pair ordering
+    i, j = np.nonzero(close)
+    yield from zip(a[i].tolist(), b[j].tolist())
@@ -1,4 +1,5 @@
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Callable, Optional
 
 from ..base import Base
 from ..constraint import Constraint
@@ -7,6 +8,8 @@ from ..mode import Mode
 from ..solvent import Solvent
 from .workflow import Workflow
 
+__all__ = ["Conformer", "ConformerSettings", "ConformerWorkflow", "CrestConformerSettings", "RdkitConformerSettings", "csearch_settings_by_mode"]
+
 
 class ConformerSettings(Base):
     num_confs_considered: int = 100
@@ -49,49 +52,51 @@ class ConformerWorkflow(Workflow):
         self.settings = csearch_settings_by_mode(self.mode, self.settings)
 
 
+# mode -> factory for fresh (mutable) settings
+_CSEARCH_SETTINGS_BY_MODE: dict[Mode, Callable[[], ConformerSettings]] = {
+    Mode.METICULOUS: partial(
+        CrestConformerSettings,
+        gfn=2,
+        flags="--ewin 15 --noreftopo",
+        max_energy=10,
+        num_confs_considered=500,
+        num_confs_taken=150,
+    ),
+    Mode.CAREFUL: partial(
+        CrestConformerSettings,
+        gfn="ff",
+        flags="--quick --ewin 10 --noreftopo",
+        num_confs_considered=150,
+        num_confs_taken=50,
+    ),
+    Mode.RAPID: partial(
+        RdkitConformerSettings,
+        num_initial_confs=300,
+        max_mmff_energy=15,
+        num_confs_considered=100,
+        num_confs_taken=50,
+    ),
+    Mode.RECKLESS: partial(
+        RdkitConformerSettings,
+        num_initial_confs=200,
+        max_mmff_energy=10,
+        num_confs_considered=50,
+        num_confs_taken=20,
+        rmsd_cutoff=0.25,
+    ),
+}
+_CSEARCH_SETTINGS_BY_MODE[Mode.AUTO] = _CSEARCH_SETTINGS_BY_MODE[Mode.RAPID]
+
+
 def csearch_settings_by_mode(mode: Mode, old_settings: Optional[ConformerSettings] = None) -> ConformerSettings:
     if mode == Mode.MANUAL:
         assert old_settings is not None
         return old_settings
 
-    settings: ConformerSettings
-
-    if mode == Mode.METICULOUS:
-        settings = CrestConformerSettings(
-            gfn=2,
-            flags="--ewin 15 --noreftopo",
-            max_energy=10,
-            num_confs_considered=500,
-            num_confs_taken=150,
-        )
-
-    elif mode == Mode.CAREFUL:
-        settings = CrestConformerSettings(
-            gfn="ff",
-            flags="--quick --ewin 10 --noreftopo",
-            num_confs_considered=150,
-            num_confs_taken=50,
-        )
-
-    elif mode == Mode.RAPID or Mode.AUTO:
-        settings = RdkitConformerSettings(
-            num_initial_confs=300,
-            max_mmff_energy=15,
-            num_confs_considered=100,
-            num_confs_taken=50,
-        )
-
-    elif mode == Mode.RECKLESS:
-        settings = RdkitConformerSettings(
-            num_initial_confs=200,
-            max_mmff_energy=10,
-            num_confs_considered=50,
-            num_confs_taken=20,
-            rmsd_cutoff=0.25,
-        )
-
-    else:
-        raise ValueError(f"invalid mode ``{mode.value}`` for conformer settings")
+    try:
+        settings = _CSEARCH_SETTINGS_BY_MODE[mode]()
+    except KeyError:
+        raise ValueError(f"invalid mode ``{mode.value}`` for conformer settings") from None
 
     if old_settings is not None:
         settings.final_method = old_settings.final_method
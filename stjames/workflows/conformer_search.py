@@ -1,9 +1,9 @@
 """Conformer Search Workflow."""
 
 from abc import ABC
-from typing import Self, Sequence, TypeVar
+from typing import Annotated, Any, Literal, Self, TypeVar
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, field_validator, model_validator
 
 from ..base import LowercaseStrEnum
 from ..constraint import Constraint
@@ -13,11 +13,28 @@ from ..types import UUID
 from .multistage_opt import MultiStageOptMixin
 from .workflow import Workflow
 
+__all__ = [
+    "ConformerGenMixin",
+    "ConformerGenSettings",
+    "ConformerSearchMixin",
+    "ConformerSearchWorkflow",
+    "ETKDGSettings",
+    "ScreeningSettings",
+    "check_sentinel",
+    "iMTDGCSettings",
+    "iMTDSettings",
+    "iMTDsMTDSettings",
+    "iMTDSpeeds",
+]
+
+# unused in stjames now that unset fields default to None; kept only for external callers of check_sentinel
 _sentinel = object()
 
 _T = TypeVar("_T")
 _U = TypeVar("_U")
 
+_ModePreset = tuple[dict[str, Any], dict[str, Any]]
+
 
 def check_sentinel(value: _T, default: _U) -> _T | _U:
     """Return value unless _sentinel, then return default."""
@@ -34,6 +51,8 @@ class ScreeningSettings(BaseModel):
     :param max_confs: maximum number of conformers to keep
     """
 
+    model_config = ConfigDict(frozen=True)
+
     energy_threshold: float | None = None  # kcal/mol
     rotational_constants_threshold: float | None = 0.02
     rmsd: float | None = 0.25
@@ -57,7 +76,7 @@ class ConformerGenSettings(BaseModel):
     mode: Mode = Mode.RAPID
     conf_opt_method: XTBMethod = Method.GFN_FF
     screening: ScreeningSettings | None = None
-    constraints: Sequence[Constraint] = tuple()
+    constraints: tuple[Constraint, ...] = ()
     nci: bool = False
     max_confs: int | None = None
 
@@ -70,6 +89,38 @@ class ConformerGenSettings(BaseModel):
         return f"<{type(self).__name__} {self.mode.name}>"
 
 
+def _apply_mode_presets(settings: ConformerGenSettings, presets: dict[Mode, _ModePreset]) -> None:
+    """
+    Apply the preset for ``settings.mode``.
+
+    :param settings: settings to update in place
+    :param presets: mode -> (values always set, defaults for fields left unset, i.e. None)
+    """
+    try:
+        values, defaults = presets[settings.mode]
+    except KeyError:
+        raise NotImplementedError(f"Unsupported mode: {settings.mode}") from None
+
+    for name, value in values.items():
+        setattr(settings, name, value)
+    for name, value in defaults.items():
+        if getattr(settings, name) is None:
+            setattr(settings, name, value)
+
+
+# (values always set, defaults for fields left unset) by mode
+_ETKDG_PRESETS: dict[Mode, _ModePreset] = {
+    Mode.RECKLESS: (
+        {"num_initial_confs": 200, "num_confs_considered": 50, "max_mmff_energy": 20},
+        {"max_confs": 20},
+    ),
+    Mode.RAPID: (
+        {"conf_opt_method": Method.GFN0_XTB},
+        {"max_confs": 50},
+    ),
+}
+
+
 class ETKDGSettings(ConformerGenSettings):
     """
     Settings for ETKDG conformer generation.
@@ -88,19 +139,21 @@ class ETKDGSettings(ConformerGenSettings):
     :param num_confs_taken: number of final conformers to take
     :param max_mmff_energy: MMFF energy cutoff
     :param max_mmff_iterations: MMFF optimization iterations
+    :param kind: discriminator for (de)serialization
     """
 
+    kind: Literal["etkdg"] = "etkdg"
     num_initial_confs: int = 300
     num_confs_considered: int = 100
     max_mmff_iterations: int = 500
     max_mmff_energy: float | None = 30
 
     @field_validator("constraints")
-    def check_constraints(cls, constraints: Sequence[Constraint]) -> Sequence[Constraint]:
+    def check_constraints(cls, constraints: tuple[Constraint, ...]) -> tuple[Constraint, ...]:
         if constraints:
             raise ValueError("ETKDG does not support constraints")
 
-        return tuple(constraints)
+        return constraints
 
     @field_validator("nci")
     def check_nci(cls, nci: bool) -> bool:
@@ -111,19 +164,8 @@ class ETKDGSettings(ConformerGenSettings):
 
     @model_validator(mode="after")
     def validate_and_build(self) -> Self:
-        match self.mode:
-            case Mode.MANUAL:
-                pass
-            case Mode.RECKLESS:
-                self.num_initial_confs = 200
-                self.num_confs_considered = 50
-                self.max_confs = 20 if self.max_confs is None else self.max_confs
-                self.max_mmff_energy = 20
-            case Mode.RAPID:
-                self.max_confs = 50 if self.max_confs is None else self.max_confs
-                self.conf_opt_method = Method.GFN0_XTB
-            case _:
-                raise NotImplementedError(f"Unsupported mode: {self.mode}")
+        if self.mode != Mode.MANUAL:
+            _apply_mode_presets(self, _ETKDG_PRESETS)
 
         return self
 
@@ -136,6 +178,34 @@ class iMTDSpeeds(LowercaseStrEnum):
     EXTENSIVE = "extensive"
 
 
+# (values always set, defaults for fields left unset) by mode
+_IMTD_PRESETS: dict[Mode, _ModePreset] = {
+    # GFN-FF//MTD(GFN-FF)
+    Mode.RECKLESS: (
+        {"speed": iMTDSpeeds.MEGAQUICK},
+        {"max_confs": 20, "reopt": True},
+    ),
+    # GFN0//MTD(GFN-FF)
+    Mode.RAPID: (
+        {"speed": iMTDSpeeds.SUPERQUICK, "conf_opt_method": Method.GFN0_XTB},
+        {"max_confs": 50, "reopt": True},
+    ),
+    # GFN2//MTD(GFN-FF)
+    Mode.CAREFUL: (
+        {"speed": iMTDSpeeds.QUICK, "conf_opt_method": Method.GFN2_XTB},
+        {"reopt": False},
+    ),
+    # GFN2//MTD(GFN2)
+    Mode.METICULOUS: (
+        {"speed": iMTDSpeeds.NORMAL, "mtd_method": Method.GFN2_XTB, "conf_opt_method": Method.GFN2_XTB},
+        {"reopt": False},
+    ),
+    # EXTREME: GFN2//MTD(GFN2)
+    #     {"speed": iMTDSpeeds.EXTENSIVE, "mtd_method": Method.GFN2_XTB, "conf_opt_method": Method.GFN2_XTB},
+    #     {"reopt": False},
+}
+
+
 class iMTDSettings(ConformerGenSettings, ABC):
     """
     Settings for iMTD style conformer generation.
@@ -201,58 +271,62 @@ class iMTDSettings(ConformerGenSettings, ABC):
     :param speed: speed of the calculations (CREST specific setting)
     :param reopt: re-optimize conformers (corrects for the lack of rotamer metadynamics and GC)
     :param free_energy_weights: calculate frequencies and re-weight based on free energies
+    :param kind: discriminator for (de)serialization
     """
 
+    kind: Literal["imtd"] = "imtd"
     mtd_method: XTBMethod = Method.GFN_FF
     mtd_runtype: str = "imtd-gc"
 
     speed: iMTDSpeeds = iMTDSpeeds.QUICK
-    reopt: bool = _sentinel  # type: ignore [assignment]
+    reopt: bool | None = None
     free_energy_weights: bool = False
 
     @model_validator(mode="after")
     def validate_and_build_imtdgc_settings(self) -> Self:
-        match self.mode:
-            case Mode.MANUAL:
-                if self.reopt is _sentinel:
-                    raise ValueError("Must specify reopt with MANUAL mode")
-            case Mode.RECKLESS:  # GFN-FF//MTD(GFN-FF)
-                self.max_confs = 20 if self.max_confs is None else self.max_confs
-                self.speed = iMTDSpeeds.MEGAQUICK
-                self.reopt = check_sentinel(self.reopt, True)
-            case Mode.RAPID:  # GFN0//MTD(GFN-FF)
-                self.max_confs = 50 if self.max_confs is None else self.max_confs
-                self.speed = iMTDSpeeds.SUPERQUICK
-                self.conf_opt_method = Method.GFN0_XTB
-                self.reopt = check_sentinel(self.reopt, True)
-            case Mode.CAREFUL:  # GFN2//MTD(GFN-FF)
-                self.speed = iMTDSpeeds.QUICK
-                self.conf_opt_method = Method.GFN2_XTB
-                self.reopt = check_sentinel(self.reopt, False)
-            case Mode.METICULOUS:  # GFN2//MTD(GFN2)
-                self.speed = iMTDSpeeds.NORMAL
-                self.mtd_method = Method.GFN2_XTB
-                self.conf_opt_method = Method.GFN2_XTB
-                self.reopt = check_sentinel(self.reopt, False)
-            # case Mode.EXTREME: # GFN2//MTD(GFN2)
-            #     self.mtd_method = Method.GFN2_XTB
-            #     self.conf_opt_method = Method.GFN2_XTB
-            #     self.speed = iMTDSpeeds.EXTENSIVE
-            #     self.reopt = check_sentinel(self.reopt, False)
-            case _:
-                raise NotImplementedError(f"Unsupported mode: {self.mode}")
+        if self.mode == Mode.MANUAL:
+            if self.reopt is None:
+                raise ValueError("Must specify reopt with MANUAL mode")
+        else:
+            _apply_mode_presets(self, _IMTD_PRESETS)
 
         return self
 
 
 class iMTDGCSettings(iMTDSettings):
+    kind: Literal["imtd-gc"] = "imtd-gc"  # type: ignore [assignment]
     run_type: str = "imtdgc"
 
 
 class iMTDsMTDSettings(iMTDSettings):
+    kind: Literal["imtd-smtd"] = "imtd-smtd"  # type: ignore [assignment]
     run_type: str = "imtd-smtd"
 
 
+def _conf_gen_settings_kind(value: Any) -> Any:
+    """
+    Tag of a ConformerGenSettings (or its dict), falling back to the plain base class when untagged.
+
+    >>> _conf_gen_settings_kind({"kind": "etkdg"}), _conf_gen_settings_kind({"mode": "manual"})
+    ('etkdg', 'base')
+    """
+    if isinstance(value, dict):
+        return value.get("kind", "base")
+
+    return getattr(value, "kind", "base")
+
+
+# tagged on ``kind``, so dicts validate straight to the right subclass and instances serialize all their fields
+_AnyConformerGenSettings = Annotated[
+    Annotated[ETKDGSettings, Tag("etkdg")]
+    | Annotated[iMTDSettings, Tag("imtd")]
+    | Annotated[iMTDGCSettings, Tag("imtd-gc")]
+    | Annotated[iMTDsMTDSettings, Tag("imtd-smtd")]
+    | Annotated[ConformerGenSettings, Tag("base")],
+    Discriminator(_conf_gen_settings_kind),
+]
+
+
 class ConformerGenMixin(BaseModel):
     """
     Mixin for workflows that need conformer generation.
@@ -265,34 +339,42 @@ class ConformerGenMixin(BaseModel):
     """
 
     conf_gen_mode: Mode = Mode.RAPID
-    conf_gen_settings: ConformerGenSettings = _sentinel  # type: ignore [assignment]
-    constraints: Sequence[Constraint] = tuple()
+    conf_gen_settings: _AnyConformerGenSettings | None = None
+    constraints: tuple[Constraint, ...] = ()
     nci: bool = False
     max_confs: int | None = None
 
     @model_validator(mode="after")
     def validate_and_build_conf_gen_settings(self) -> Self:
         """Validate and build the ConformerGenSettings."""
-        if self.conf_gen_settings is not _sentinel and self.conf_gen_mode != Mode.MANUAL:
+        if self.conf_gen_settings is not None and self.conf_gen_mode != Mode.MANUAL:
             raise ValueError("Cannot specify conf_gen_settings with non-MANUAL mode")
 
-        match self.conf_gen_mode:
-            case Mode.MANUAL:
-                if self.conf_gen_settings is _sentinel:
-                    raise ValueError("Must specify conf_gen_settings with MANUAL mode")
+        if self.conf_gen_mode == Mode.MANUAL:
+            if self.conf_gen_settings is None:
+                raise ValueError("Must specify conf_gen_settings with MANUAL mode")
+            return self
 
-            case Mode.RECKLESS | Mode.RAPID:
-                # ETKDGSettings will error if constraints or nci are set
-                self.conf_gen_settings = ETKDGSettings(mode=self.conf_gen_mode, constraints=self.constraints, nci=self.nci, max_confs=self.max_confs)
-            case Mode.CAREFUL | Mode.METICULOUS:
-                self.conf_gen_settings = iMTDSettings(mode=self.conf_gen_mode, constraints=self.constraints, nci=self.nci, max_confs=self.max_confs)
+        try:
+            settings_type = _CONF_GEN_SETTINGS_BY_MODE[self.conf_gen_mode]
+        except KeyError:
+            raise NotImplementedError(f"Unsupported mode: {self.conf_gen_mode}") from None
 
-            case _:
-                raise NotImplementedError(f"Unsupported mode: {self.conf_gen_mode}")
+        # ETKDGSettings will error if constraints or nci are set
+        self.conf_gen_settings = settings_type(mode=self.conf_gen_mode, constraints=self.constraints, nci=self.nci, max_confs=self.max_confs)
 
         return self
 
 
+# mode -> conformer generation settings built by ConformerGenMixin
+_CONF_GEN_SETTINGS_BY_MODE: dict[Mode, type[ETKDGSettings] | type[iMTDSettings]] = {
+    Mode.RECKLESS: ETKDGSettings,
+    Mode.RAPID: ETKDGSettings,
+    Mode.CAREFUL: iMTDSettings,
+    Mode.METICULOUS: iMTDSettings,
+}
+
+
 class ConformerSearchMixin(ConformerGenMixin, MultiStageOptMixin):
     """
     Mixin for workflows that need conformer search—a combination of conformer generation and optimization.
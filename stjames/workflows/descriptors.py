@@ -1,11 +1,30 @@
+from typing import Any
+
+from pydantic import TypeAdapter
+
 from ..types import UUID
 from .workflow import Workflow
 
+__all__ = ["Descriptors", "DescriptorsWorkflow"]
+
 Descriptors = dict[str, dict[str, float] | tuple[float | None, ...] | float]
 
+# built once, as compiling the schema for this union is far slower than validating with it
+_DESCRIPTORS_ADAPTER: TypeAdapter[Descriptors] = TypeAdapter(Descriptors)
+
 
 class DescriptorsWorkflow(Workflow):
     # UUID of optimization
     optimization: UUID | None = None
 
     descriptors: Descriptors | None = None
+
+    @staticmethod
+    def validate_descriptors(descriptors: Any) -> Descriptors:
+        """
+        Validate descriptors on their own, e.g. for partial updates.
+
+        >>> DescriptorsWorkflow.validate_descriptors({"SlogP": "1.5", "Kappa": [1, None]})
+        {'SlogP': 1.5, 'Kappa': (1.0, None)}
+        """
+        return _DESCRIPTORS_ADAPTER.validate_python(descriptors)
@@ -1,12 +1,16 @@
-from pydantic import NonNegativeFloat, NonNegativeInt
+from pydantic import ConfigDict, NonNegativeFloat, NonNegativeInt
 
 from ..base import Base
 from ..settings import Settings
 from ..types import UUID, FloatPerAtom, Matrix3x3, Vector3D
 from .workflow import Workflow
 
+__all__ = ["ElectronicPropertiesWorkflow", "MolecularOrbitalCube", "PropertyCube", "PropertyCubePoint"]
+
 
 class PropertyCubePoint(Base):
+    model_config = ConfigDict(frozen=True)
+
     x: float
     y: float
     z: float
@@ -1,6 +1,8 @@
 from ..types import UUID
 from .workflow import Workflow
 
+__all__ = ["FukuiIndexWorkflow"]
+
 
 class FukuiIndexWorkflow(Workflow):
     # UUID of optimization
@@ -8,6 +8,8 @@ from ..settings import Settings
 from ..types import UUID
 from .workflow import Workflow
 
+__all__ = ["Frame", "MolecularDynamicsInitialization", "MolecularDynamicsSettings", "MolecularDynamicsWorkflow", "ThermodynamicEnsemble"]
+
 
 class MolecularDynamicsInitialization(LowercaseStrEnum):
     RANDOM = "random"
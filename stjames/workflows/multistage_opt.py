@@ -12,6 +12,8 @@ from ..task import Task
 from ..types import UUID
 from .workflow import Workflow
 
+__all__ = ["MultiStageOptMixin", "MultiStageOptSettings", "MultiStageOptWorkflow", "build_mso_settings"]
+
 
 class MultiStageOptSettings(BaseModel):
     """
@@ -52,7 +54,7 @@ class MultiStageOptSettings(BaseModel):
     singlepoint_settings: Settings | None = None
     solvent: Solvent | None = None
     xtb_preopt: bool = False
-    constraints: Sequence[Constraint] = tuple()
+    constraints: tuple[Constraint, ...] = ()
     transition_state: bool = False
     frequencies: bool = False
 
@@ -228,7 +230,7 @@ class MultiStageOptMixin(BaseModel):
     multistage_opt_settings: MultiStageOptSettings = _sentinel_msos  # type: ignore [assignment]
     solvent: Solvent | None = None
     xtb_preopt: bool = False
-    constraints: Sequence[Constraint] = tuple()
+    constraints: tuple[Constraint, ...] = ()
     transition_state: bool = False
     frequencies: bool = False
 
@@ -4,6 +4,8 @@ from ..base import Base
 from ..mode import Mode
 from .workflow import DBCalculation, Workflow
 
+__all__ = ["pKaMicrostate", "pKaWorkflow"]
+
 
 class pKaMicrostate(Base):
     atom_index: int
@@ -8,6 +8,8 @@ from ..types import UUID
 from .multistage_opt import MultiStageOptMixin
 from .workflow import Workflow
 
+__all__ = ["RedoxPotentialWorkflow"]
+
 _T = TypeVar("_T")
 
 
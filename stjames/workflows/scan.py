@@ -7,6 +7,8 @@ from ..settings import Settings
 from ..types import UUID
 from .workflow import Workflow
 
+__all__ = ["ScanPoint", "ScanSettings", "ScanWorkflow"]
+
 
 class ScanPoint(Base):
     index: int
@@ -7,6 +7,8 @@ from ..types import UUID
 from .multistage_opt import MultiStageOptMixin
 from .workflow import Workflow
 
+__all__ = ["SpinState", "SpinStatesWorkflow"]
+
 
 class SpinState(BaseModel):
     """
@@ -4,6 +4,8 @@ from ..base import Base
 from ..mode import Mode
 from .workflow import DBCalculation, Workflow
 
+__all__ = ["Tautomer", "TautomerWorkflow"]
+
 
 class Tautomer(Base):
     energy: float
@@ -6,6 +6,8 @@ from ..mode import Mode
 from ..molecule import Molecule
 from ..types import UUID
 
+__all__ = ["Workflow", "DBCalculation"]
+
 
 class Workflow(Base):
     """
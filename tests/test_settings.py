@@ -1,4 +1,4 @@
-from stjames import Constraint, Mode, OptimizationSettings, Settings
+from stjames import Constraint, Mode, OptimizationSettings, Settings, Task
 
 
 def test_set_mode_auto() -> None:
@@ -32,3 +32,33 @@ def test_opt_settings() -> None:
     assert met_opt_set.energy_threshold == 1e-6
     assert met_opt_set.max_gradient_threshold == 3e-5
     assert met_opt_set.rms_gradient_threshold == 2e-5
+
+
+def test_manual_mode() -> None:
+    opt_settings = OptimizationSettings(max_gradient_threshold=1e-2, energy_threshold=1e-3)
+    settings = Settings(mode=Mode.MANUAL, opt_settings=opt_settings)
+
+    assert settings.mode == Mode.MANUAL
+    assert settings.opt_settings.max_gradient_threshold == 1e-2
+    assert settings.opt_settings.energy_threshold == 1e-3
+
+
+def test_optimize_ts() -> None:
+    settings = Settings(tasks=[Task.OPTIMIZE_TS, Task.FREQUENCIES])
+    both = Settings(tasks=[Task.OPTIMIZE, Task.OPTIMIZE_TS])
+
+    assert settings.tasks == [Task.FREQUENCIES, Task.OPTIMIZE]
+    assert settings.opt_settings.transition_state
+    assert both.tasks == [Task.OPTIMIZE]
+    assert both.opt_settings.transition_state
+
+
+def test_basis_sets_not_shared() -> None:
+    a = Settings(method="b3lyp", basis_set="def2-svp")
+    b = Settings(method="b3lyp", basis_set="def2-svp")
+
+    assert a.basis_set is not None and b.basis_set is not None
+    assert a.basis_set is not b.basis_set
+
+    a.basis_set.cutoff_threshold = 1e-8
+    assert b.basis_set.cutoff_threshold == 1e-10
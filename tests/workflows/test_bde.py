@@ -40,6 +40,8 @@ H   1.15  0.00  1.10
 def test_raises(water: Molecule) -> None:
     with raises(ValueError):
         BDEWorkflow(initial_molecule=water, mode=Mode.RAPID, atoms=[5])
+    with raises(ValueError):
+        BDEWorkflow(initial_molecule=water, mode=Mode.RAPID, fragment_indices=[(1, 4)])
 
 
 def test_auto(water: Molecule) -> None:
@@ -48,6 +50,20 @@ def test_auto(water: Molecule) -> None:
     assert wf.mode == Mode.RAPID
 
 
+def test_default_mode(water: Molecule) -> None:
+    wf = BDEWorkflow(initial_molecule=water, atoms=[1, 2])
+
+    assert wf.mode == Mode.RAPID
+    assert wf.mso_mode == Mode.RAPID
+
+
+def test_input_not_mutated(water: Molecule) -> None:
+    values = {"initial_molecule": water, "atoms": [1, 2]}
+    BDEWorkflow.model_validate(values)
+
+    assert values == {"initial_molecule": water, "atoms": [1, 2]}
+
+
 def test_frequencies(water: Molecule) -> None:
     wf = BDEWorkflow(initial_molecule=water, mode=Mode.RAPID, atoms=[1, 2], frequencies=True)
     wf2 = BDEWorkflow(initial_molecule=water, mode=Mode.RAPID, atoms=[1, 2])
@@ -134,6 +150,22 @@ def test_mode_defaults(chloroethane: Molecule, mode: Mode, opt_frag: bool) -> No
     assert wf.optimize_fragments == opt_frag
 
 
+@mark.parametrize(
+    "mode, opt_frag, expected",
+    [
+        (Mode.RECKLESS, True, False),
+        (Mode.RAPID, False, False),
+        (Mode.METICULOUS, False, False),
+        (Mode.METICULOUS, True, True),
+    ],
+)
+def test_optimize_fragments(chloroethane: Molecule, mode: Mode, opt_frag: bool, expected: bool) -> None:
+    """User choice is kept, except in RECKLESS mode (GFN-FF doesn't support open-shell species)."""
+    wf = BDEWorkflow(initial_molecule=chloroethane, mode=mode, atoms=[4], optimize_fragments=opt_frag)
+
+    assert wf.optimize_fragments == expected
+
+
 def test_BDE_none() -> None:
     """Test that a BDE with None for an energy is fine."""
 
@@ -0,0 +1,49 @@
+from pytest import mark, raises
+
+from stjames import Method, Mode
+from stjames.workflows import Conformer, CrestConformerSettings, RdkitConformerSettings, csearch_settings_by_mode
+
+
+@mark.parametrize(
+    "mode, settings_type, num_confs_taken",
+    [
+        (Mode.RECKLESS, RdkitConformerSettings, 20),
+        (Mode.RAPID, RdkitConformerSettings, 50),
+        (Mode.AUTO, RdkitConformerSettings, 50),
+        (Mode.CAREFUL, CrestConformerSettings, 50),
+        (Mode.METICULOUS, CrestConformerSettings, 150),
+    ],
+)
+def test_csearch_settings_by_mode(mode: Mode, settings_type: type, num_confs_taken: int) -> None:
+    settings = csearch_settings_by_mode(mode)
+
+    assert type(settings) is settings_type
+    assert settings.num_confs_taken == num_confs_taken
+
+
+def test_csearch_settings_keeps_old_settings() -> None:
+    old = RdkitConformerSettings(final_method=Method.GFN2_XTB, solvent=None)
+    reckless = csearch_settings_by_mode(Mode.RECKLESS, old)
+
+    assert reckless.rmsd_cutoff == 0.25
+    assert reckless.final_method == Method.GFN2_XTB
+    assert reckless.solvent is None
+    assert csearch_settings_by_mode(Mode.MANUAL, old) is old
+
+    # each call builds fresh settings
+    assert csearch_settings_by_mode(Mode.RECKLESS) is not csearch_settings_by_mode(Mode.RECKLESS)
+
+
+def test_csearch_settings_invalid_mode() -> None:
+    with raises(ValueError):
+        csearch_settings_by_mode(Mode.DEBUG)
+
+
+def test_conformer_is_mutable() -> None:
+    """Conformer weights and uuids are filled in after the energies are known."""
+    conformer = Conformer(energy=-1.0)
+    conformer.weight = 0.5
+    conformer.uuid = "abc"
+
+    assert conformer.weight == 0.5
+    assert conformer.uuid == "abc"
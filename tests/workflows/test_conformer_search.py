@@ -5,11 +5,14 @@ from stjames import Constraint, Mode, Molecule
 from stjames.method import Method
 from stjames.workflows.conformer_search import (
     ConformerGenMixin,
+    ConformerGenSettings,
     ConformerSearchMixin,
     ConformerSearchWorkflow,
     ETKDGSettings,
     ScreeningSettings,
+    iMTDGCSettings,
     iMTDSettings,
+    iMTDsMTDSettings,
     iMTDSpeeds,
 )
 
@@ -113,6 +116,44 @@ def test_conformer_gen_mixin() -> None:
     assert meticulous.conf_gen_settings == iMTDSettings(mode=Mode.METICULOUS)
 
 
+def test_manual_requires_settings() -> None:
+    manual = iMTDSettings(mode=Mode.MANUAL, reopt=False)
+    assert manual.reopt is False
+    assert ConformerGenMixin(conf_gen_mode=Mode.MANUAL, conf_gen_settings=manual).conf_gen_settings == manual
+
+    with raises(ValidationError, match="Must specify reopt"):
+        iMTDSettings(mode=Mode.MANUAL)
+
+    with raises(ValidationError, match="Must specify conf_gen_settings"):
+        ConformerGenMixin(conf_gen_mode=Mode.MANUAL)
+
+    with raises(ValidationError, match="Cannot specify conf_gen_settings"):
+        ConformerGenMixin(conf_gen_settings=manual)
+
+
+def test_conf_gen_settings_roundtrip() -> None:
+    """conf_gen_settings keeps its subclass through a dump and reload."""
+    for settings in [ETKDGSettings(mode=Mode.RECKLESS), iMTDSettings(mode=Mode.CAREFUL), iMTDGCSettings(), iMTDsMTDSettings()]:
+        mixin = ConformerGenMixin(conf_gen_mode=Mode.MANUAL, conf_gen_settings=settings)
+
+        reloaded = ConformerGenMixin.model_validate_json(mixin.model_dump_json()).conf_gen_settings
+
+        assert type(reloaded) is type(settings)
+        assert reloaded.model_dump_json() == settings.model_dump_json()
+
+
+def test_untagged_conf_gen_settings() -> None:
+    """conf_gen_settings without a kind falls back to the base ConformerGenSettings."""
+    from_dict = ConformerGenMixin.model_validate({"conf_gen_mode": "manual", "conf_gen_settings": {"mode": "manual"}})
+    from_instance = ConformerGenMixin(conf_gen_mode=Mode.MANUAL, conf_gen_settings=ConformerGenSettings(mode=Mode.MANUAL))
+
+    assert type(from_dict.conf_gen_settings) is ConformerGenSettings
+    assert from_dict.conf_gen_settings == from_instance.conf_gen_settings
+
+    with raises(ValidationError, match="union_tag_invalid"):
+        ConformerGenMixin(conf_gen_mode=Mode.MANUAL, conf_gen_settings={"kind": "unknown"})
+
+
 def test_screening_settings() -> None:
     settings = ScreeningSettings(energy_threshold=10)
 
@@ -142,7 +183,7 @@ def test_conformer_search_mixin() -> None:
     assert rapid.frequencies
     assert not careful_reckless.frequencies
 
-    assert careful_reckless.constraints == [Constraint(constraint_type="bond", atoms=[1, 2])]
+    assert careful_reckless.constraints == (Constraint(constraint_type="bond", atoms=[1, 2]),)
     assert meticulous_rapid.constraints == ()
 
 
@@ -1,6 +1,7 @@
-from pytest import fixture
+from pydantic import ValidationError
+from pytest import fixture, raises
 
-from stjames import Atom, ElectronicPropertiesWorkflow, Molecule, Settings
+from stjames import Atom, ElectronicPropertiesWorkflow, Molecule, PropertyCubePoint, Settings
 
 
 @fixture
@@ -73,3 +74,12 @@ def test_electronic_properties(Mn: Molecule, Fe: Molecule) -> None:
     assert epw2.molecular_orbitals == {}
     assert epw2.molecular_orbitals_alpha == {}
     assert epw2.molecular_orbitals_beta == {}
+
+
+def test_property_cube_point() -> None:
+    point = PropertyCubePoint(x=0, y=1, z=2, val=0.5)
+
+    with raises(ValidationError):
+        point.val = 1.0
+
+    assert len({point, PropertyCubePoint(x=0, y=1, z=2, val=0.5)}) == 1
@@ -0,0 +1,52 @@
+import ast
+from importlib import import_module
+from pathlib import Path
+from typing import Any, get_args
+
+import stjames.workflows
+from stjames.workflows import WORKFLOW_MAPPING, WORKFLOW_NAME, Workflow
+
+
+def test_lazy_imports_match_all() -> None:
+    """Each submodule's ``__all__`` is exactly what ``stjames.workflows`` lazily exports from it."""
+    by_module: dict[str, set[str]] = {}
+    for name, module in stjames.workflows._LAZY_IMPORTS.items():
+        by_module.setdefault(module, set()).add(name)
+
+    for module, names in by_module.items():
+        submodule = import_module(module, "stjames.workflows")
+
+        assert set(submodule.__all__) == names
+        assert all(getattr(stjames.workflows, name) is getattr(submodule, name) for name in names)
+
+
+def test_type_checking_imports_match_lazy_imports() -> None:
+    """The ``TYPE_CHECKING`` imports in ``stjames.workflows`` are exactly ``_LAZY_IMPORTS``."""
+    assert stjames.workflows.__file__
+    tree = ast.parse(Path(stjames.workflows.__file__).read_text())
+    block = next(node for node in tree.body if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING")
+
+    imported = {alias.name: f".{node.module}" for node in block.body if isinstance(node, ast.ImportFrom) for alias in node.names}
+
+    assert imported == stjames.workflows._LAZY_IMPORTS
+
+
+def test_workflow_mapping() -> None:
+    """``WORKFLOW_NAME`` and ``WORKFLOW_MAPPING`` cover the same workflows."""
+    assert list(WORKFLOW_MAPPING) == list(get_args(WORKFLOW_NAME))
+    assert all(issubclass(cls, Workflow) for cls in WORKFLOW_MAPPING.values())
+
+
+def test_star_import() -> None:
+    """``from stjames import *`` includes the lazily loaded workflows."""
+    namespace: dict[str, Any] = {}
+    exec("from stjames import *", namespace)
+
+    assert {"Molecule", "Settings", *stjames.workflows.__all__} <= namespace.keys()
+    assert namespace["BDEWorkflow"] is stjames.workflows.BDEWorkflow
+
+
+def test_top_level_all() -> None:
+    """``stjames.__all__`` lists the package API, not whatever the star-imported modules happen to import."""
+    assert len(stjames.__all__) == len(set(stjames.__all__))
+    assert {"math", "ConfigDict", "TYPE_CHECKING", "Any", "np", "workflows"}.isdisjoint(stjames.__all__)